@@ -1,6 +1,8 @@
 import os
+import logging
 import typer
 from rich.console import Console
+from rich.logging import RichHandler
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt
@@ -18,6 +20,21 @@ from app.database import queries
 app = typer.Typer()
 console = Console()
 
+def setup_logging():
+    """Show the application's log records (e.g. agent step timings) in the console."""
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(message)s",
+        handlers=[RichHandler(console=console, show_path=False)],
+    )
+    # Third-party libraries stay at WARNING; LOG_LEVEL controls the app's own loggers
+    log_level = (os.getenv("LOG_LEVEL") or "WARNING").upper()
+    try:
+        logging.getLogger("app").setLevel(log_level)
+    except ValueError:
+        logging.getLogger("app").setLevel(logging.WARNING)
+        logging.getLogger("app").warning(f"Unknown LOG_LEVEL '{log_level}', using WARNING.")
+
 def check_database():
     """Check if the database has been initialized with data."""
     try:
@@ -78,6 +95,7 @@ def main():
     """Main CLI entrypoint."""
     # Register signal handler for graceful shutdown
     signal.signal(signal.SIGTERM, handle_sigterm)
+    setup_logging()
     
     display_welcome()
     